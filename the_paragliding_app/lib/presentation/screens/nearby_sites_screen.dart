@@ -766,7 +766,7 @@ class NearbySitesScreenState extends State<NearbySitesScreen> with WidgetsBindin
       }).toList();
 
       // Combine PGE favorites with deduplicated local favorites
-      final sites = <ParaglidingSite>[...pgeFavorites, ...deduplicatedLocalFavorites];
+      var sites = <ParaglidingSite>[...pgeFavorites, ...deduplicatedLocalFavorites];
 
       LoggingService.action('NearbySites', 'favorites_menu_opened', {
         'local_favorites': localFavorites.length,
@@ -776,22 +776,19 @@ class NearbySitesScreenState extends State<NearbySitesScreen> with WidgetsBindin
       });
 
       // Sort by distance from user position if available
+      // Distances are computed once per site, not twice per comparison
       if (_userPosition != null && sites.isNotEmpty) {
-        sites.sort((a, b) {
-          final distA = Geolocator.distanceBetween(
+        final sitesWithDistance = sites.map((site) {
+          final distance = Geolocator.distanceBetween(
             _userPosition!.latitude,
             _userPosition!.longitude,
-            a.latitude,
-            a.longitude,
+            site.latitude,
+            site.longitude,
           );
-          final distB = Geolocator.distanceBetween(
-            _userPosition!.latitude,
-            _userPosition!.longitude,
-            b.latitude,
-            b.longitude,
-          );
-          return distA.compareTo(distB);
-        });
+          return (site, distance);
+        }).toList();
+        sitesWithDistance.sort((a, b) => a.$2.compareTo(b.$2));
+        sites = sitesWithDistance.map((tuple) => tuple.$1).toList();
       }
 
       if (mounted) {
@@ -80,6 +80,19 @@ class WeatherStationMarker extends StatelessWidget {
 class _WeatherStationPainter extends CustomPainter {
   final WindData? windData;
 
+  /// Paints are identical for every marker, so share them rather than
+  /// allocating two per marker on every repaint
+  static final Paint _circlePaint = Paint()
+    ..color = Colors.grey[800]!
+    ..style = PaintingStyle.stroke
+    ..strokeWidth = 2.0;
+
+  static final Paint _barbPaint = Paint()
+    ..color = Colors.grey[800]!
+    ..style = PaintingStyle.stroke
+    ..strokeWidth = 2.5
+    ..strokeCap = StrokeCap.round;
+
   _WeatherStationPainter({
     required this.windData,
   });
@@ -92,12 +105,7 @@ class _WeatherStationPainter extends CustomPainter {
     final circleRadius = 6.0;
 
     // Draw circle outline only (no fill)
-    final circlePaint = Paint()
-      ..color = Colors.grey[800]!
-      ..style = PaintingStyle.stroke
-      ..strokeWidth = 2.0;
-
-    canvas.drawCircle(center, circleRadius, circlePaint);
+    canvas.drawCircle(center, circleRadius, _circlePaint);
 
     // Draw wind barb only if wind speed >= 1 km/h (calm winds show circle only)
     final data = windData;
@@ -107,33 +115,30 @@ class _WeatherStationPainter extends CustomPainter {
   }
 
   void _drawWindBarb(Canvas canvas, Offset center, double circleRadius, WindData windData) {
-    final barbPaint = Paint()
-      ..color = Colors.grey[800]!
-      ..style = PaintingStyle.stroke
-      ..strokeWidth = 2.5
-      ..strokeCap = StrokeCap.round;
-
     // Convert wind direction to radians (meteorological convention: direction FROM)
     // Rotate so north (0°) points up
     final angle = (windData.directionDegrees - 90) * math.pi / 180;
 
+    final cosAngle = math.cos(angle);
+    final sinAngle = math.sin(angle);
+
     // Shaft starts at circle edge and extends outward
     final shaftStart = Offset(
-      center.dx + circleRadius * math.cos(angle),
-      center.dy + circleRadius * math.sin(angle),
+      center.dx + circleRadius * cosAngle,
+      center.dy + circleRadius * sinAngle,
     );
 
     final shaftLength = 25.0;
     final shaftEnd = Offset(
-      shaftStart.dx + shaftLength * math.cos(angle),
-      shaftStart.dy + shaftLength * math.sin(angle),
+      shaftStart.dx + shaftLength * cosAngle,
+      shaftStart.dy + shaftLength * sinAngle,
     );
 
     // Draw main shaft
-    canvas.drawLine(shaftStart, shaftEnd, barbPaint);
+    canvas.drawLine(shaftStart, shaftEnd, _barbPaint);
 
     // Draw speed barbs
-    _drawSpeedBarbs(canvas, shaftEnd, angle, windData.speedKmh, barbPaint);
+    _drawSpeedBarbs(canvas, shaftEnd, angle, windData.speedKmh, _barbPaint);
   }
 
   void _drawSpeedBarbs(Canvas canvas, Offset shaftEnd, double angle, double speedKmh, Paint paint) {
@@ -148,18 +153,25 @@ class _WeatherStationPainter extends CustomPainter {
     final barbSpacing = 5.0;  // Spacing between barbs
     final barbAngle = 60 * math.pi / 180; // 60 degrees from shaft
 
+    // Shaft and barb directions are the same for every barb, so compute the
+    // trig once rather than per barb
+    final cosAngle = math.cos(angle);
+    final sinAngle = math.sin(angle);
+    final cosBarb = math.cos(angle + barbAngle);
+    final sinBarb = math.sin(angle + barbAngle);
+
     // Start from the end of the shaft and work backwards
     double distanceFromEnd = 2.0; // Small offset from shaft end
 
     // Draw half barb first (closest to end, like NOAA standard)
     if (halfBarb && fullBarbs < 5) {
       final barbBase = Offset(
-        shaftEnd.dx - distanceFromEnd * math.cos(angle),
-        shaftEnd.dy - distanceFromEnd * math.sin(angle),
+        shaftEnd.dx - distanceFromEnd * cosAngle,
+        shaftEnd.dy - distanceFromEnd * sinAngle,
       );
       final barbTip = Offset(
-        barbBase.dx + (barbLength / 2) * math.cos(angle + barbAngle),
-        barbBase.dy + (barbLength / 2) * math.sin(angle + barbAngle),
+        barbBase.dx + (barbLength / 2) * cosBarb,
+        barbBase.dy + (barbLength / 2) * sinBarb,
       );
       canvas.drawLine(barbBase, barbTip, paint);
       distanceFromEnd += barbSpacing;
@@ -168,12 +180,12 @@ class _WeatherStationPainter extends CustomPainter {
     // Draw full barbs (working backwards from end)
     for (int i = 0; i < fullBarbs && i < 5; i++) {
       final barbBase = Offset(
-        shaftEnd.dx - distanceFromEnd * math.cos(angle),
-        shaftEnd.dy - distanceFromEnd * math.sin(angle),
+        shaftEnd.dx - distanceFromEnd * cosAngle,
+        shaftEnd.dy - distanceFromEnd * sinAngle,
       );
       final barbTip = Offset(
-        barbBase.dx + barbLength * math.cos(angle + barbAngle),
-        barbBase.dy + barbLength * math.sin(angle + barbAngle),
+        barbBase.dx + barbLength * cosBarb,
+        barbBase.dy + barbLength * sinBarb,
       );
       canvas.drawLine(barbBase, barbTip, paint);
       distanceFromEnd += barbSpacing;
@@ -209,23 +209,21 @@ class SiteMatchingService {
       return [];
     }
 
-    final nearbyStites = <ParaglidingSite>[];
+    // Keep each distance alongside its site so the sort doesn't recompute
+    // two haversines per comparison
+    final sitesWithDistance = <(ParaglidingSite, double)>[];
 
     for (final site in _sites!) {
       final distance = site.distanceTo(latitude, longitude);
       if (distance <= radiusMeters) {
-        nearbyStites.add(site);
+        sitesWithDistance.add((site, distance));
       }
     }
 
     // Sort by distance
-    nearbyStites.sort((a, b) {
-      final distanceA = a.distanceTo(latitude, longitude);
-      final distanceB = b.distanceTo(latitude, longitude);
-      return distanceA.compareTo(distanceB);
-    });
+    sitesWithDistance.sort((a, b) => a.$2.compareTo(b.$2));
 
-    return nearbyStites;
+    return sitesWithDistance.map((tuple) => tuple.$1).toList();
   }
 
   /// Search sites by name (case-insensitive)
@@ -1,4 +1,3 @@
-import 'dart:convert';
 import 'package:http/http.dart' as http;
 import 'package:flutter_map/flutter_map.dart';
 import 'package:latlong2/latlong.dart';
@@ -7,8 +6,12 @@ import '../../data/models/weather_station_source.dart';
 import '../../data/models/wind_data.dart';
 import '../../utils/map_constants.dart';
 import '../logging_service.dart';
+import 'weather_http_client.dart';
 import 'weather_station_provider.dart';
 
+/// Station cache key: bbox edges in half-degree steps (west, south, east, north)
+typedef _BoundsCacheKey = (int, int, int, int);
+
 /// Aviation Weather Center provider from aviationweather.gov
 /// Provides airport weather stations with real-time observations in METAR format
 class AviationWeatherCenterProvider implements WeatherStationProvider {
@@ -19,10 +22,10 @@ class AviationWeatherCenterProvider implements WeatherStationProvider {
   static const double knotsToKmh = 1.852;
 
   /// Cache for station lists: "bbox_key" -> {stations, timestamp}
-  final Map<String, _StationCacheEntry> _stationCache = {};
+  final Map<_BoundsCacheKey, _StationCacheEntry> _stationCache = {};
 
   /// Cache for pending station list requests to prevent duplicate API calls
-  final Map<String, Future<List<WeatherStation>>> _pendingStationRequests = {};
+  final Map<_BoundsCacheKey, Future<List<WeatherStation>>> _pendingStationRequests = {};
 
   @override
   WeatherStationSource get source => WeatherStationSource.awcMetar;
@@ -62,7 +65,7 @@ class AviationWeatherCenterProvider implements WeatherStationProvider {
     // Check exact cache match first
     final cached = _stationCache[cacheKey];
     if (cached != null && !cached.isExpired) {
-      LoggingService.info('AWC_METAR station cache hit for $cacheKey (${cached.stations.length} stations)');
+      LoggingService.info('AWC_METAR station cache hit for ${_cacheKeyToString(cacheKey)} (${cached.stations.length} stations)');
       return cached.stations;
     }
 
@@ -74,7 +77,7 @@ class AviationWeatherCenterProvider implements WeatherStationProvider {
       }).toList();
 
       LoggingService.structured('AWC_METAR_CACHE_SUBSET', {
-        'cache_key': cacheKey,
+        'cache_key': _cacheKeyToString(cacheKey),
         'cached_total': containingCache.stations.length,
         'filtered_count': filteredStations.length,
       });
@@ -84,7 +87,7 @@ class AviationWeatherCenterProvider implements WeatherStationProvider {
 
     // Check if request is already pending
     if (_pendingStationRequests.containsKey(cacheKey)) {
-      LoggingService.info('Waiting for pending AWC_METAR station request: $cacheKey');
+      LoggingService.info('Waiting for pending AWC_METAR station request: ${_cacheKeyToString(cacheKey)}');
       return _pendingStationRequests[cacheKey]!;
     }
 
@@ -149,15 +152,16 @@ class AviationWeatherCenterProvider implements WeatherStationProvider {
   /// Returns stations with embedded wind data in METAR format
   Future<List<WeatherStation>> _fetchStationsInBounds(
     LatLngBounds bounds,
-    String cacheKey,
+    _BoundsCacheKey cacheKey,
   ) async {
+    // Build bbox string once: minLat,minLon,maxLat,maxLon
+    // Shared by the URL and every log entry, including the failure path
+    final bbox = '${bounds.south.toStringAsFixed(2)},${bounds.west.toStringAsFixed(2)},'
+                 '${bounds.north.toStringAsFixed(2)},${bounds.east.toStringAsFixed(2)}';
+
     try {
       final stopwatch = Stopwatch()..start();
 
-      // Build bbox string: minLat,minLon,maxLat,maxLon
-      final bbox = '${bounds.south.toStringAsFixed(2)},${bounds.west.toStringAsFixed(2)},'
-                   '${bounds.north.toStringAsFixed(2)},${bounds.east.toStringAsFixed(2)}';
-
       // Build Aviation Weather Center METAR API URL
       final url = Uri.parse(
         'https://aviationweather.gov/api/data/metar?bbox=$bbox&format=json',
@@ -166,27 +170,29 @@ class AviationWeatherCenterProvider implements WeatherStationProvider {
       LoggingService.structured('AWC_METAR_REQUEST_START', {
         'bbox': bbox,
         'url': url.toString(),
-        'cache_key': cacheKey,
+        'cache_key': _cacheKeyToString(cacheKey),
       });
 
       // Make API request with appropriate headers
-      final response = await http.get(
+      final response = await WeatherHttpClient.withHostSlot(
         url,
-        headers: {
-          'Accept': 'application/json',
-          'User-Agent': 'TheParaglidingApp/1.0',
-        },
-      ).timeout(
-        const Duration(seconds: 30),
-        onTimeout: () {
-          stopwatch.stop();
-          LoggingService.structured('AWC_METAR_TIMEOUT', {
-            'bbox': bbox,
-            'duration_ms': stopwatch.elapsedMilliseconds,
-            'timeout_seconds': 30,
-          });
-          return http.Response('{"error": "Request timeout"}', 408);
-        },
+        () => WeatherHttpClient.client.get(
+          url,
+          headers: {
+            'Accept': 'application/json',
+          },
+        ).timeout(
+          const Duration(seconds: 30),
+          onTimeout: () {
+            stopwatch.stop();
+            LoggingService.structured('AWC_METAR_TIMEOUT', {
+              'bbox': bbox,
+              'duration_ms': stopwatch.elapsedMilliseconds,
+              'timeout_seconds': 30,
+            });
+            return http.Response('{"error": "Request timeout"}', 408);
+          },
+        ),
       );
 
       stopwatch.stop();
@@ -194,7 +200,7 @@ class AviationWeatherCenterProvider implements WeatherStationProvider {
       LoggingService.structured('AWC_METAR_RESPONSE_RECEIVED', {
         'status_code': response.statusCode,
         'duration_ms': stopwatch.elapsedMilliseconds,
-        'content_length': response.body.length,
+        'content_length': response.bodyBytes.length,
         'bbox': bbox,
       });
 
@@ -203,7 +209,7 @@ class AviationWeatherCenterProvider implements WeatherStationProvider {
 
         // Start parse timing
         final parseStopwatch = Stopwatch()..start();
-        final List<dynamic> stationList = jsonDecode(response.body) as List;
+        final List<dynamic> stationList = WeatherHttpClient.decodeJson(response.bodyBytes) as List;
         final List<WeatherStation> stations = [];
 
         for (final stationJson in stationList) {
@@ -236,7 +242,7 @@ class AviationWeatherCenterProvider implements WeatherStationProvider {
           'network_ms': networkTime,
           'parse_ms': parseStopwatch.elapsedMilliseconds,
           'total_ms': stopwatch.elapsedMilliseconds,
-          'cache_key': cacheKey,
+          'cache_key': _cacheKeyToString(cacheKey),
         });
 
         return stations;
@@ -270,8 +276,8 @@ class AviationWeatherCenterProvider implements WeatherStationProvider {
       LoggingService.structured('AWC_METAR_REQUEST_FAILED', {
         'error_type': e.runtimeType.toString(),
         'error_message': e.toString(),
-        'bbox': '${bounds.south.toStringAsFixed(2)},${bounds.west.toStringAsFixed(2)},${bounds.north.toStringAsFixed(2)},${bounds.east.toStringAsFixed(2)}',
-        'cache_key': cacheKey,
+        'bbox': bbox,
+        'cache_key': _cacheKeyToString(cacheKey),
       });
       LoggingService.error('Failed to fetch AWC_METAR stations', e, stackTrace);
       return [];
@@ -338,15 +344,23 @@ class AviationWeatherCenterProvider implements WeatherStationProvider {
   }
 
   /// Generate cache key from bounding box
-  String _getBoundsCacheKey(LatLngBounds bounds) {
+  /// Integer record rather than a formatted string: cheaper to hash, and
+  /// [_findContainingCache] can read the edges back without parsing
+  _BoundsCacheKey _getBoundsCacheKey(LatLngBounds bounds) {
     // Round to 0.5 degrees (~50km) for coarse cache granularity
     // Reduces unnecessary API calls for small map pans
-    final west = (bounds.west * 2).round() / 2;
-    final south = (bounds.south * 2).round() / 2;
-    final east = (bounds.east * 2).round() / 2;
-    final north = (bounds.north * 2).round() / 2;
+    return (
+      (bounds.west * 2).round(),
+      (bounds.south * 2).round(),
+      (bounds.east * 2).round(),
+      (bounds.north * 2).round(),
+    );
+  }
 
-    return '$west,$south,$east,$north';
+  /// Cache key edges in degrees (west,south,east,north) for logging
+  String _cacheKeyToString(_BoundsCacheKey key) {
+    final (west, south, east, north) = key;
+    return '${west / 2},${south / 2},${east / 2},${north / 2}';
   }
 
   /// Find a cached entry whose bounds contain or significantly overlap the requested bounds
@@ -360,37 +374,31 @@ class AviationWeatherCenterProvider implements WeatherStationProvider {
     for (final entry in _stationCache.entries) {
       if (entry.value.isExpired) continue;
 
-      final parts = entry.key.split(',');
-      if (parts.length != 4) continue;
-
-      try {
-        final cachedWest = double.parse(parts[0]);
-        final cachedSouth = double.parse(parts[1]);
-        final cachedEast = double.parse(parts[2]);
-        final cachedNorth = double.parse(parts[3]);
-        final cachedBounds = LatLngBounds(
-          LatLng(cachedSouth, cachedWest),
-          LatLng(cachedNorth, cachedEast),
-        );
-
-        // Check for complete containment (100% coverage)
-        if (cachedWest <= requestedBounds.west &&
-            cachedSouth <= requestedBounds.south &&
-            cachedEast >= requestedBounds.east &&
-            cachedNorth >= requestedBounds.north) {
-          return entry.value; // Perfect match, return immediately
-        }
+      final (west, south, east, north) = entry.key;
+      final cachedWest = west / 2;
+      final cachedSouth = south / 2;
+      final cachedEast = east / 2;
+      final cachedNorth = north / 2;
+
+      // Check for complete containment (100% coverage)
+      if (cachedWest <= requestedBounds.west &&
+          cachedSouth <= requestedBounds.south &&
+          cachedEast >= requestedBounds.east &&
+          cachedNorth >= requestedBounds.north) {
+        return entry.value; // Perfect match, return immediately
+      }
 
-        // Check for significant overlap (>70% coverage)
-        if (_boundsOverlap(requestedBounds, cachedBounds)) {
-          final overlapPct = _calculateOverlapPercentage(requestedBounds, cachedBounds);
-          if (overlapPct > 0.70 && overlapPct > bestOverlap) {
-            bestMatch = entry.value;
-            bestOverlap = overlapPct;
-          }
+      // Check for significant overlap (>70% coverage)
+      final cachedBounds = LatLngBounds(
+        LatLng(cachedSouth, cachedWest),
+        LatLng(cachedNorth, cachedEast),
+      );
+      if (_boundsOverlap(requestedBounds, cachedBounds)) {
+        final overlapPct = _calculateOverlapPercentage(requestedBounds, cachedBounds);
+        if (overlapPct > 0.70 && overlapPct > bestOverlap) {
+          bestMatch = entry.value;
+          bestOverlap = overlapPct;
         }
-      } catch (e) {
-        continue;
       }
     }
 
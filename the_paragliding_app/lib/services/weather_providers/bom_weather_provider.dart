@@ -7,6 +7,7 @@ import '../../data/models/weather_station_source.dart';
 import '../../data/models/wind_data.dart';
 import '../../utils/map_constants.dart';
 import '../logging_service.dart';
+import 'weather_http_client.dart';
 import 'weather_station_provider.dart';
 
 /// Bureau of Meteorology (BOM) weather station provider from reg.bom.gov.au
@@ -229,6 +230,7 @@ class BomWeatherProvider implements WeatherStationProvider {
     try {
       final stopwatch = Stopwatch()..start();
       final url = state.url;
+      final uri = Uri.parse(url);
 
       LoggingService.structured('BOM_STATE_REQUEST_START', {
         'state': state.code,
@@ -236,23 +238,25 @@ class BomWeatherProvider implements WeatherStationProvider {
         'url': url,
       });
 
-      final response = await http.get(
-        Uri.parse(url),
-        headers: {
-          'Accept': 'text/xml',
-          'User-Agent': 'TheParaglidingApp/1.0',
-        },
-      ).timeout(
-        const Duration(seconds: 30),
-        onTimeout: () {
-          stopwatch.stop();
-          LoggingService.structured('BOM_STATE_TIMEOUT', {
-            'state': state.code,
-            'duration_ms': stopwatch.elapsedMilliseconds,
-            'timeout_seconds': 30,
-          });
-          return http.Response('{"error": "Request timeout"}', 408);
-        },
+      final response = await WeatherHttpClient.withHostSlot(
+        uri,
+        () => WeatherHttpClient.client.get(
+          uri,
+          headers: {
+            'Accept': 'text/xml',
+          },
+        ).timeout(
+          const Duration(seconds: 30),
+          onTimeout: () {
+            stopwatch.stop();
+            LoggingService.structured('BOM_STATE_TIMEOUT', {
+              'state': state.code,
+              'duration_ms': stopwatch.elapsedMilliseconds,
+              'timeout_seconds': 30,
+            });
+            return http.Response('{"error": "Request timeout"}', 408);
+          },
+        ),
       );
 
       stopwatch.stop();
@@ -1,3 +1,4 @@
+import 'dart:async';
 import 'dart:convert';
 import 'package:http/http.dart' as http;
 import 'package:flutter_map/flutter_map.dart';
@@ -8,6 +9,8 @@ import '../../data/models/wind_data.dart';
 import '../../utils/map_constants.dart';
 import '../logging_service.dart';
 import '../api_keys.dart';
+import 'weather_http_client.dart';
+import 'weather_response_disk_cache.dart';
 import 'weather_station_provider.dart';
 
 /// FFVL (French Free Flight Federation) weather beacon provider from data.ffvl.fr
@@ -27,6 +30,9 @@ class FfvlWeatherProvider implements WeatherStationProvider {
   // FFVL API endpoints (HTTPS with trailing slash)
   static const String _baseUrl = 'https://data.ffvl.fr/api/';
 
+  /// Disk cache key for the raw beacon list response
+  static const String _beaconListDiskCacheKey = 'ffvl_beacon_list';
+
   /// Global cache entry (single entry for all beacons)
   _GlobalCacheEntry? _globalCache;
 
@@ -80,12 +86,10 @@ class FfvlWeatherProvider implements WeatherStationProvider {
 
       // Step 1: Check if beacon list cache is valid (<24hr)
       if (_globalCache != null && !_globalCache!.beaconListExpired) {
-        // Step 2: Check if ANY stations exist in current view
-        final hasStationsInView = _globalCache!.stations.any((s) =>
-          bounds.contains(LatLng(s.latitude, s.longitude))
-        );
+        // Step 2: Collect the stations in the current view
+        final stationsInView = _filterStationsToBounds(_globalCache!.stations, bounds);
 
-        if (!hasStationsInView) {
+        if (stationsInView.isEmpty) {
           // No stations to display - skip measurement refresh API call
           LoggingService.structured('FFVL_NO_STATIONS_IN_VIEW', {
             'bounds': '${bounds.south},${bounds.west},${bounds.north},${bounds.east}',
@@ -101,48 +105,34 @@ class FfvlWeatherProvider implements WeatherStationProvider {
           LoggingService.info('FFVL measurements expired, refreshing');
           onApiCallStart?.call(); // Notify UI that API call is starting
           await _refreshMeasurements();
-        } else {
-          LoggingService.structured('FFVL_CACHE_HIT', {
-            'total_beacons': _globalCache!.stations.length,
-            'beacon_list_age_min': DateTime.now()
-                .difference(_globalCache!.beaconListTimestamp)
-                .inMinutes,
-            'measurements_age_min': DateTime.now()
-                .difference(_globalCache!.measurementsTimestamp)
-                .inMinutes,
-          });
+
+          // Step 4: Refresh replaced the station list - filter it again
+          return _filterStationsToBounds(_globalCache!.stations, bounds);
         }
 
-        // Step 4: Filter to bbox and return
-        return _filterStationsToBounds(_globalCache!.stations, bounds);
+        LoggingService.structured('FFVL_CACHE_HIT', {
+          'total_beacons': _globalCache!.stations.length,
+          'beacon_list_age_min': DateTime.now()
+              .difference(_globalCache!.beaconListTimestamp)
+              .inMinutes,
+          'measurements_age_min': DateTime.now()
+              .difference(_globalCache!.measurementsTimestamp)
+              .inMinutes,
+        });
+
+        // Step 4: Measurements are fresh - reuse the in-view pass
+        return stationsInView;
       }
 
       // Step 4: No valid cache - fetch everything from API
-      if (_pendingGlobalRequest != null) {
-        LoggingService.info('Waiting for pending FFVL global request');
-        await _pendingGlobalRequest;
-        // Check if the request succeeded and cache was populated
-        if (_globalCache != null) {
-          return _filterStationsToBounds(_globalCache!.stations, bounds);
-        } else {
-          // Request failed, return empty list
-          LoggingService.warning('FFVL global request completed but cache is null');
-          return [];
-        }
+      if (_pendingGlobalRequest == null) {
+        onApiCallStart?.call(); // Notify UI that API call is starting
       }
-
-      // Fetch all beacons
-      onApiCallStart?.call(); // Notify UI that API call is starting
-      _pendingGlobalRequest = _fetchAllBeacons();
-      try {
-        await _pendingGlobalRequest;
-        if (_globalCache == null) {
-          return []; // Failed to fetch
-        }
-        return _filterStationsToBounds(_globalCache!.stations, bounds);
-      } finally {
-        _pendingGlobalRequest = null;
+      await _fetchAllBeaconsShared();
+      if (_globalCache == null) {
+        return []; // Failed to fetch
       }
+      return _filterStationsToBounds(_globalCache!.stations, bounds);
     } catch (e, stackTrace) {
       LoggingService.error('Failed to fetch FFVL beacons', e, stackTrace);
       return [];
@@ -176,6 +166,7 @@ class FfvlWeatherProvider implements WeatherStationProvider {
   void clearCache() {
     _globalCache = null;
     _pendingGlobalRequest = null;
+    unawaited(WeatherResponseDiskCache.instance.remove(_beaconListDiskCacheKey));
     LoggingService.info('FFVL global cache cleared');
   }
 
@@ -202,92 +193,113 @@ class FfvlWeatherProvider implements WeatherStationProvider {
     };
   }
 
+  /// Run _fetchAllBeacons, sharing one in-flight request between concurrent callers
+  ///
+  /// A first load and a measurement refresh (or two map moves) arriving
+  /// together would otherwise each download the full global payload.
+  Future<List<WeatherStation>> _fetchAllBeaconsShared() async {
+    final pending = _pendingGlobalRequest;
+    if (pending != null) {
+      LoggingService.info('Waiting for pending FFVL global request');
+      return pending;
+    }
+
+    final request = _fetchAllBeacons();
+    _pendingGlobalRequest = request;
+    try {
+      return await request;
+    } finally {
+      // clearCache() may have dropped or replaced the pending request
+      if (identical(_pendingGlobalRequest, request)) {
+        _pendingGlobalRequest = null;
+      }
+    }
+  }
+
   /// Fetch all beacons from FFVL API
   /// Fetches both beacon list and measurements to get complete data
   Future<List<WeatherStation>> _fetchAllBeacons() async {
     try {
       final stopwatch = Stopwatch()..start();
 
-      // Fetch beacon list first
+      // Beacon list and measurements are independent endpoints, so request
+      // them concurrently - latency is the slower call rather than the sum
       final apiKey = ApiKeys.ffvlApiKey;
       final beaconListUrl = Uri.parse(
         '$_baseUrl?base=balises&r=list&mode=json&key=$apiKey',
       );
+      final measurementsUrl = Uri.parse(
+        '$_baseUrl?base=balises&r=releves_meteo&key=$apiKey',
+      );
+
+      // Beacon locations rarely change, so a recent beacon list on disk is
+      // reused across app restarts and every 5-minute measurement refresh
+      final cachedBeaconList = await WeatherResponseDiskCache.instance.read(
+        _beaconListDiskCacheKey,
+        MapConstants.ffvlBeaconListCacheTTL,
+      );
 
       LoggingService.structured('FFVL_REQUEST_START', {
         'url': beaconListUrl.toString().replaceAll(apiKey, '***'),
         'strategy': 'fetch_all_global',
+        'beacon_list_source': cachedBeaconList != null ? 'disk' : 'network',
       });
 
-      final beaconListResponse = await http.get(
-        beaconListUrl,
-        headers: {
-          'Accept': 'application/json',
-          'User-Agent': 'TheParaglidingApp/1.0',
-        },
-      ).timeout(
-        const Duration(seconds: 30),
-        onTimeout: () {
-          stopwatch.stop();
-          LoggingService.structured('FFVL_TIMEOUT', {
-            'url': 'beacon_list',
-            'duration_ms': stopwatch.elapsedMilliseconds,
-            'timeout_seconds': 30,
-          });
-          return http.Response('{"error": "Request timeout"}', 408);
-        },
-      );
-
-      if (beaconListResponse.statusCode != 200) {
-        LoggingService.structured('FFVL_HTTP_ERROR', {
-          'endpoint': 'beacon_list',
-          'status_code': beaconListResponse.statusCode,
-          'duration_ms': stopwatch.elapsedMilliseconds,
-        });
-        return [];
-      }
-
-      // Parse beacon list
-      final List<dynamic> beaconList = jsonDecode(beaconListResponse.body);
-
-      // Create a map for quick lookup
-      final Map<String, Map<String, dynamic>> beaconMap = {};
-      for (final beacon in beaconList) {
-        // The API is inconsistent about whether ids are strings or numbers,
-        // so normalise rather than cast
-        final id = beacon['idBalise']?.toString();
-        if (id != null) {
-          beaconMap[id] = beacon as Map<String, dynamic>;
-        }
+      Future<http.Response> fetchBeaconList() {
+        return WeatherHttpClient.withHostSlot(
+          beaconListUrl,
+          () => WeatherHttpClient.client.get(
+            beaconListUrl,
+            headers: {
+              'Accept': 'application/json',
+            },
+          ).timeout(
+            const Duration(seconds: 30),
+            onTimeout: () {
+              LoggingService.structured('FFVL_TIMEOUT', {
+                'url': 'beacon_list',
+                'duration_ms': stopwatch.elapsedMilliseconds,
+                'timeout_seconds': 30,
+              });
+              return http.Response('{"error": "Request timeout"}', 408);
+            },
+          ),
+        );
       }
 
-      // Fetch current measurements
-      final measurementsUrl = Uri.parse(
-        '$_baseUrl?base=balises&r=releves_meteo&key=$apiKey',
-      );
+      final beaconListFuture = cachedBeaconList != null
+          ? Future<http.Response?>.value(null)
+          : fetchBeaconList();
 
-      final measurementsResponse = await http.get(
+      // Measurements are refetched every few minutes, so parse them straight
+      // from the byte stream rather than buffering the whole body first
+      final measurementsFuture = WeatherHttpClient.withHostSlot(
         measurementsUrl,
-        headers: {
-          'Accept': 'application/json',
-          'User-Agent': 'TheParaglidingApp/1.0',
-        },
-      ).timeout(
-        const Duration(seconds: 30),
-        onTimeout: () {
-          LoggingService.structured('FFVL_TIMEOUT', {
-            'url': 'measurements',
-            'duration_ms': stopwatch.elapsedMilliseconds,
-            'timeout_seconds': 30,
-          });
-          return http.Response('{"error": "Request timeout"}', 408);
-        },
+        () => WeatherHttpClient.getJson(
+          measurementsUrl,
+          headers: {
+            'Accept': 'application/json',
+          },
+        ).timeout(
+          const Duration(seconds: 30),
+          onTimeout: () {
+            LoggingService.structured('FFVL_TIMEOUT', {
+              'url': 'measurements',
+              'duration_ms': stopwatch.elapsedMilliseconds,
+              'timeout_seconds': 30,
+            });
+            return (statusCode: 408, json: null);
+          },
+        ),
       );
 
+      final (beaconListResponse, measurementsResponse) =
+          await (beaconListFuture, measurementsFuture).wait;
+
       // Parse measurements response - it's a List not a Map
       Map<String, Map<String, dynamic>> measurementsMap = {};
       if (measurementsResponse.statusCode == 200) {
-        final measurementsList = jsonDecode(measurementsResponse.body);
+        final measurementsList = measurementsResponse.json;
         if (measurementsList is List) {
           for (final measurement in measurementsList) {
             if (measurement is Map<String, dynamic>) {
@@ -301,6 +313,54 @@ class FfvlWeatherProvider implements WeatherStationProvider {
         }
       }
 
+      // A disk copy's embedded last_* readings are older than the 1-hour
+      // freshness guard, so they can't stand in for a failed measurements
+      // request - fetch the live beacon list, as before the disk cache
+      var networkBeaconList = beaconListResponse;
+      if (networkBeaconList == null && measurementsMap.isEmpty) {
+        LoggingService.structured('FFVL_DISK_BEACON_LIST_BYPASSED', {
+          'measurements_status': measurementsResponse.statusCode,
+        });
+        networkBeaconList = await fetchBeaconList();
+      }
+
+      final String beaconListBody;
+      if (networkBeaconList == null) {
+        beaconListBody = cachedBeaconList!.body;
+      } else {
+        if (networkBeaconList.statusCode != 200) {
+          LoggingService.structured('FFVL_HTTP_ERROR', {
+            'endpoint': 'beacon_list',
+            'status_code': networkBeaconList.statusCode,
+            'duration_ms': stopwatch.elapsedMilliseconds,
+          });
+          return [];
+        }
+        beaconListBody = networkBeaconList.body;
+      }
+
+      // Parse beacon list
+      final List<dynamic> beaconList = jsonDecode(beaconListBody);
+
+      // Only persist a body that parsed as a beacon list
+      if (networkBeaconList != null) {
+        unawaited(WeatherResponseDiskCache.instance.write(
+          _beaconListDiskCacheKey,
+          beaconListBody,
+        ));
+      }
+
+      // Create a map for quick lookup
+      final Map<String, Map<String, dynamic>> beaconMap = {};
+      for (final beacon in beaconList) {
+        // The API is inconsistent about whether ids are strings or numbers,
+        // so normalise rather than cast
+        final id = beacon['idBalise']?.toString();
+        if (id != null) {
+          beaconMap[id] = beacon as Map<String, dynamic>;
+        }
+      }
+
       stopwatch.stop();
 
       LoggingService.structured('FFVL_MEASUREMENTS_PARSED', {
@@ -353,7 +413,7 @@ class FfvlWeatherProvider implements WeatherStationProvider {
       final now = DateTime.now();
       _globalCache = _GlobalCacheEntry(
         stations: stations,
-        beaconListTimestamp: now,
+        beaconListTimestamp: networkBeaconList == null ? cachedBeaconList!.savedAt : now,
         measurementsTimestamp: now,
         bounds: cachedBounds,
       );
@@ -376,11 +436,29 @@ class FfvlWeatherProvider implements WeatherStationProvider {
 
       return stations;
     } catch (e, stackTrace) {
+      var error = e;
+      var errorStackTrace = stackTrace;
+      String? failedRequest;
+
+      // The concurrent `.wait` wraps failures in a ParallelWaitError - report
+      // the request that failed with its own error instead of the wrapper
+      if (e is ParallelWaitError) {
+        if (e.errors case (AsyncError? beaconListError, AsyncError? measurementsError)) {
+          final failure = beaconListError ?? measurementsError;
+          if (failure != null) {
+            error = failure.error;
+            errorStackTrace = failure.stackTrace;
+            failedRequest = beaconListError != null ? 'beacon_list' : 'measurements';
+          }
+        }
+      }
+
       LoggingService.structured('FFVL_REQUEST_FAILED', {
-        'error_type': e.runtimeType.toString(),
-        'error_message': e.toString(),
+        'error_type': error.runtimeType.toString(),
+        'error_message': error.toString(),
+        if (failedRequest != null) 'failed_request': failedRequest,
       });
-      LoggingService.error('Failed to fetch FFVL beacons', e, stackTrace);
+      LoggingService.error('Failed to fetch FFVL beacons', error, errorStackTrace);
       return [];
     }
   }
@@ -389,9 +467,13 @@ class FfvlWeatherProvider implements WeatherStationProvider {
   /// Re-fetches measurements but keeps the beacon list
   Future<void> _refreshMeasurements() async {
     try {
-      // We need to re-fetch both endpoints since the beacon list API
-      // also contains embedded measurements that we can use as fallback
-      final beacons = await _fetchAllBeacons();
+      // Re-runs the full fetch. The beacon list usually comes from the disk
+      // cache; if the measurements request fails, the live list is fetched
+      // so its embedded last_* readings can stand in. A beacon missing from
+      // an otherwise successful feed falls back to the disk copy's readings,
+      // which are usually past the 1-hour freshness guard, so it shows no
+      // wind until the feed includes it again
+      final beacons = await _fetchAllBeaconsShared();
       if (beacons.isNotEmpty && _globalCache != null) {
         // Recalculate bbox from refreshed stations
         final refreshedBounds = _calculateBoundsFromStations(beacons);
@@ -697,9 +779,20 @@ class FfvlWeatherProvider implements WeatherStationProvider {
     List<WeatherStation> stations,
     LatLngBounds bounds,
   ) {
-    final filtered = stations.where((station) {
-      return bounds.contains(LatLng(station.latitude, station.longitude));
-    }).toList();
+    // Compare raw coordinates rather than building a LatLng per station
+    final south = bounds.south;
+    final north = bounds.north;
+    final west = bounds.west;
+    final east = bounds.east;
+
+    final filtered = <WeatherStation>[];
+    for (final station in stations) {
+      final lat = station.latitude;
+      final lon = station.longitude;
+      if (lat >= south && lat <= north && lon >= west && lon <= east) {
+        filtered.add(station);
+      }
+    }
 
     LoggingService.structured('FFVL_BBOX_FILTER', {
       'total_beacons': stations.length,
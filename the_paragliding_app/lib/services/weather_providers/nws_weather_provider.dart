@@ -1,4 +1,3 @@
-import 'dart:convert';
 import 'dart:math';
 import 'package:http/http.dart' as http;
 import 'package:flutter_map/flutter_map.dart';
@@ -8,8 +7,15 @@ import '../../data/models/weather_station_source.dart';
 import '../../data/models/wind_data.dart';
 import '../../utils/map_constants.dart';
 import '../logging_service.dart';
+import 'weather_http_client.dart';
 import 'weather_station_provider.dart';
 
+/// Station cache key: bbox edges in 0.1 degree steps (west, south, east, north)
+typedef _BoundsCacheKey = (int, int, int, int);
+
+/// Coverage bounding box in degrees
+typedef _CoverageBox = ({double west, double south, double east, double north});
+
 /// National Weather Service (NWS) weather station provider
 /// Provides real-time weather observations from api.weather.gov
 ///
@@ -30,42 +36,47 @@ class NwsWeatherProvider implements WeatherStationProvider {
 
   /// Cache for station lists: "bbox_key" -> {stations, bounds, timestamp}
   /// Stores bbox containing all stations from grid point lookup
-  final Map<String, _StationCacheEntry> _stationCache = {};
+  final Map<_BoundsCacheKey, _StationCacheEntry> _stationCache = {};
+
+  /// Cache for /points lookups: point in 0.01 degree steps -> observationStations URL
+  /// Grid assignments don't change, so a hit skips the first of the two
+  /// dependent requests needed to list a grid's stations
+  final Map<(int, int), _GridUrlCacheEntry> _gridUrlCache = {};
 
   /// Cache for individual station observations: "station_id" -> {windData, timestamp}
   final Map<String, _ObservationCacheEntry> _observationCache = {};
 
   /// Pending station list requests to prevent duplicate API calls
-  final Map<String, Future<List<WeatherStation>>> _pendingStationRequests = {};
+  final Map<_BoundsCacheKey, Future<List<WeatherStation>>> _pendingStationRequests = {};
 
   /// Pending observation requests to prevent duplicate API calls
   final Map<String, Future<WindData?>> _pendingObservationRequests = {};
 
-  /// NWS coverage areas (US and territories only)
-  /// Format: [west, south, east, north] in WGS84 (EPSG:4326)
-  /// Based on nws_bounding_boxes.py
-  static const Map<String, List<double>> _coverageAreas = {
+  /// NWS coverage areas (US and territories only), in WGS84 (EPSG:4326)
+  /// Based on nws_bounding_boxes.py, with Alaska split at the dateline and the
+  /// overlapping combined regions dropped. Records rather than a map of lists
+  /// so the per-request checks read fields directly
+  static const List<_CoverageBox> _coverageAreas = [
     // Continental United States (Lower 48 + DC)
-    'CONUS': [-125.0, 24.5, -66.9, 49.6],
+    (west: -125.0, south: 24.5, east: -66.9, north: 49.6), // CONUS
 
     // Alaska - split into two regions to handle International Date Line crossing
     // Main Alaska and most Aleutians (western hemisphere)
-    'Alaska_Main': [-180.0, 51.214183, -130.0, 71.365162],
+    (west: -180.0, south: 51.214183, east: -130.0, north: 71.365162), // Alaska_Main
     // Western Aleutian Islands extending past the dateline (eastern hemisphere)
-    'Alaska_West_Aleutians': [172.0, 51.214183, 180.0, 71.365162],
+    (west: 172.0, south: 51.214183, east: 180.0, north: 71.365162), // Alaska_West_Aleutians
 
-    // Hawaii
-    'Hawaii': [-178.334698, 18.910361, -154.806773, 28.402123],
+    (west: -178.334698, south: 18.910361, east: -154.806773, north: 28.402123), // Hawaii
 
     // Caribbean territories
-    'Puerto_Rico': [-67.945404, 17.88328, -65.220703, 18.515683],
-    'US_Virgin_Islands': [-65.085452, 17.673976, -64.564907, 18.412655],
+    (west: -67.945404, south: 17.88328, east: -65.220703, north: 18.515683), // Puerto_Rico
+    (west: -65.085452, south: 17.673976, east: -64.564907, north: 18.412655), // US_Virgin_Islands
 
     // Pacific territories
-    'Guam': [144.618068, 13.234189, 144.956712, 13.654383],
-    'Northern_Mariana_Islands': [144.886331, 14.110472, 146.064818, 20.553802],
-    'American_Samoa': [-171.089874, -14.548699, -168.1433, -11.046934],
-  };
+    (west: 144.618068, south: 13.234189, east: 144.956712, north: 13.654383), // Guam
+    (west: 144.886331, south: 14.110472, east: 146.064818, north: 20.553802), // Northern_Mariana_Islands
+    (west: -171.089874, south: -14.548699, east: -168.1433, north: -11.046934), // American_Samoa
+  ];
 
   @override
   WeatherStationSource get source => WeatherStationSource.nws;
@@ -115,7 +126,7 @@ class NwsWeatherProvider implements WeatherStationProvider {
     final cached = _stationCache[cacheKey];
     if (cached != null && !cached.isExpired) {
       LoggingService.structured('NWS_CACHE_HIT', {
-        'cache_key': cacheKey,
+        'cache_key': _cacheKeyToString(cacheKey),
         'stations': cached.stations.length,
       });
       return cached.stations;
@@ -141,7 +152,7 @@ class NwsWeatherProvider implements WeatherStationProvider {
 
     // Step 3: Check if request is already pending
     if (_pendingStationRequests.containsKey(cacheKey)) {
-      LoggingService.info('Waiting for pending NWS station request: $cacheKey');
+      LoggingService.info('Waiting for pending NWS station request: ${_cacheKeyToString(cacheKey)}');
       return _pendingStationRequests[cacheKey]!;
     }
 
@@ -189,8 +200,9 @@ class NwsWeatherProvider implements WeatherStationProvider {
   @override
   void clearCache() {
     _stationCache.clear();
+    _gridUrlCache.clear();
     _observationCache.clear();
-    LoggingService.info('NWS cache cleared (stations and observations)');
+    LoggingService.info('NWS cache cleared (stations, grid lookups and observations)');
   }
 
   @override
@@ -206,6 +218,7 @@ class NwsWeatherProvider implements WeatherStationProvider {
       'station_cache_entries': _stationCache.length,
       'valid_station_entries': validStationEntries,
       'total_cached_stations': totalStations,
+      'grid_url_cache_entries': _gridUrlCache.length,
       'observation_cache_entries': _observationCache.length,
       'valid_observation_entries': validObservationEntries,
       'pending_station_requests': _pendingStationRequests.length,
@@ -216,7 +229,7 @@ class NwsWeatherProvider implements WeatherStationProvider {
   /// Fetch stations from NWS grid point lookup
   Future<List<WeatherStation>> _fetchStationsFromGrid(
     LatLngBounds requestedBounds,
-    String cacheKey,
+    _BoundsCacheKey cacheKey,
   ) async {
     try {
       // Calculate bbox center for grid point lookup
@@ -224,7 +237,7 @@ class NwsWeatherProvider implements WeatherStationProvider {
       final centerLon = (requestedBounds.east + requestedBounds.west) / 2;
 
       LoggingService.structured('NWS_CACHE_MISS', {
-        'cache_key': cacheKey,
+        'cache_key': _cacheKeyToString(cacheKey),
         'center_lat': centerLat.toStringAsFixed(4),
         'center_lon': centerLon.toStringAsFixed(4),
       });
@@ -241,7 +254,7 @@ class NwsWeatherProvider implements WeatherStationProvider {
         );
 
         LoggingService.structured('NWS_NON_US_CACHED', {
-          'cache_key': cacheKey,
+          'cache_key': _cacheKeyToString(cacheKey),
           'bounds': _boundsToString(requestedBounds),
         });
 
@@ -296,30 +309,47 @@ class NwsWeatherProvider implements WeatherStationProvider {
       return null;
     }
 
+    // Quantise the point to 0.01 degrees (~1km, finer than the 2.5km NWS
+    // grid) so nearby map centres share a cached /points lookup. The point is
+    // just the view centre, so shifting it by a few hundred metres is harmless
+    final gridKey = ((lat * 100).round(), (lon * 100).round());
+    final cachedGrid = _gridUrlCache[gridKey];
+    if (cachedGrid != null && !cachedGrid.isExpired) {
+      LoggingService.structured('NWS_POINT_CACHE_HIT', {
+        'grid_url': cachedGrid.gridUrl,
+      });
+      return cachedGrid.gridUrl;
+    }
+    // Format the point once for the URL and logs
+    final pointLat = (gridKey.$1 / 100).toStringAsFixed(4);
+    final pointLon = (gridKey.$2 / 100).toStringAsFixed(4);
+
     try {
       final stopwatch = Stopwatch()..start();
-      final url = Uri.parse('$_baseUrl/points/${lat.toStringAsFixed(4)},${lon.toStringAsFixed(4)}');
+      final url = Uri.parse('$_baseUrl/points/$pointLat,$pointLon');
 
       LoggingService.structured('NWS_POINT_REQUEST', {
-        'lat': lat.toStringAsFixed(4),
-        'lon': lon.toStringAsFixed(4),
+        'lat': pointLat,
+        'lon': pointLon,
       });
 
-      final response = await http.get(
+      final response = await WeatherHttpClient.withHostSlot(
         url,
-        headers: {
-          'Accept': 'application/geo+json',
-          'User-Agent': 'TheParaglidingApp/1.0',
-        },
-      ).timeout(
-        const Duration(seconds: 10),
-        onTimeout: () {
-          LoggingService.structured('NWS_POINT_TIMEOUT', {
-            'lat': lat,
-            'lon': lon,
-          });
-          return http.Response('{"error": "Timeout"}', 408);
-        },
+        () => WeatherHttpClient.client.get(
+          url,
+          headers: {
+            'Accept': 'application/geo+json',
+          },
+        ).timeout(
+          const Duration(seconds: 10),
+          onTimeout: () {
+            LoggingService.structured('NWS_POINT_TIMEOUT', {
+              'lat': pointLat,
+              'lon': pointLon,
+            });
+            return http.Response('{"error": "Timeout"}', 408);
+          },
+        ),
       );
 
       stopwatch.stop();
@@ -327,15 +357,19 @@ class NwsWeatherProvider implements WeatherStationProvider {
       if (response.statusCode == 404) {
         // Location outside US coverage
         LoggingService.structured('NWS_NON_US_LOCATION', {
-          'lat': lat,
-          'lon': lon,
+          'lat': pointLat,
+          'lon': pointLon,
           'duration_ms': stopwatch.elapsedMilliseconds,
         });
+        _gridUrlCache[gridKey] = _GridUrlCacheEntry(
+          gridUrl: null,
+          timestamp: DateTime.now(),
+        );
         return null;
       }
 
       if (response.statusCode == 200) {
-        final data = jsonDecode(response.body) as Map<String, dynamic>;
+        final data = WeatherHttpClient.decodeJson(response.bodyBytes) as Map<String, dynamic>;
         final properties = data['properties'] as Map<String, dynamic>?;
         final gridUrl = properties?['observationStations'] as String?;
 
@@ -344,6 +378,13 @@ class NwsWeatherProvider implements WeatherStationProvider {
           'duration_ms': stopwatch.elapsedMilliseconds,
         });
 
+        if (gridUrl != null) {
+          _gridUrlCache[gridKey] = _GridUrlCacheEntry(
+            gridUrl: gridUrl,
+            timestamp: DateTime.now(),
+          );
+        }
+
         return gridUrl;
       }
 
@@ -368,20 +409,22 @@ class NwsWeatherProvider implements WeatherStationProvider {
         'grid_url': gridUrl,
       });
 
-      final response = await http.get(
+      final response = await WeatherHttpClient.withHostSlot(
         url,
-        headers: {
-          'Accept': 'application/geo+json',
-          'User-Agent': 'TheParaglidingApp/1.0',
-        },
-      ).timeout(
-        const Duration(seconds: 30),
-        onTimeout: () {
-          LoggingService.structured('NWS_GRID_TIMEOUT', {
-            'grid_url': gridUrl,
-          });
-          return http.Response('{"error": "Timeout"}', 408);
-        },
+        () => WeatherHttpClient.client.get(
+          url,
+          headers: {
+            'Accept': 'application/geo+json',
+          },
+        ).timeout(
+          const Duration(seconds: 30),
+          onTimeout: () {
+            LoggingService.structured('NWS_GRID_TIMEOUT', {
+              'grid_url': gridUrl,
+            });
+            return http.Response('{"error": "Timeout"}', 408);
+          },
+        ),
       );
 
       stopwatch.stop();
@@ -395,7 +438,7 @@ class NwsWeatherProvider implements WeatherStationProvider {
       }
 
       // Parse GeoJSON response
-      final data = jsonDecode(response.body) as Map<String, dynamic>;
+      final data = WeatherHttpClient.decodeJson(response.bodyBytes) as Map<String, dynamic>;
       final features = data['features'] as List?;
 
       if (features == null || features.isEmpty) {
@@ -513,13 +556,15 @@ class NwsWeatherProvider implements WeatherStationProvider {
         'station_id': stationId,
       });
 
-      final response = await http.get(
+      final response = await WeatherHttpClient.withHostSlot(
         url,
-        headers: {
-          'Accept': 'application/geo+json',
-          'User-Agent': 'TheParaglidingApp/1.0',
-        },
-      ).timeout(const Duration(seconds: 10));
+        () => WeatherHttpClient.client.get(
+          url,
+          headers: {
+            'Accept': 'application/geo+json',
+          },
+        ).timeout(const Duration(seconds: 10)),
+      );
 
       if (response.statusCode != 200) {
         LoggingService.structured('NWS_OBSERVATION_ERROR', {
@@ -529,7 +574,7 @@ class NwsWeatherProvider implements WeatherStationProvider {
         return null;
       }
 
-      final data = jsonDecode(response.body) as Map<String, dynamic>;
+      final data = WeatherHttpClient.decodeJson(response.bodyBytes) as Map<String, dynamic>;
       final properties = data['properties'] as Map<String, dynamic>?;
 
       if (properties == null) {
@@ -597,13 +642,8 @@ class NwsWeatherProvider implements WeatherStationProvider {
 
   /// Check if a point is within NWS coverage area
   bool _isPointInCoverageArea(double lat, double lon) {
-    for (final bbox in _coverageAreas.values) {
-      final west = bbox[0];
-      final south = bbox[1];
-      final east = bbox[2];
-      final north = bbox[3];
-
-      if (lon >= west && lon <= east && lat >= south && lat <= north) {
+    for (final box in _coverageAreas) {
+      if (lon >= box.west && lon <= box.east && lat >= box.south && lat <= box.north) {
         return true;
       }
     }
@@ -612,17 +652,14 @@ class NwsWeatherProvider implements WeatherStationProvider {
 
   /// Check if requested bounds overlap with any NWS coverage area
   bool _isBoundsInCoverageArea(LatLngBounds bounds) {
-    for (final bbox in _coverageAreas.values) {
-      final coverageWest = bbox[0];
-      final coverageSouth = bbox[1];
-      final coverageEast = bbox[2];
-      final coverageNorth = bbox[3];
+    final west = bounds.west;
+    final south = bounds.south;
+    final east = bounds.east;
+    final north = bounds.north;
 
+    for (final box in _coverageAreas) {
       // Check if bounding boxes overlap
-      if (bounds.west <= coverageEast &&
-          bounds.east >= coverageWest &&
-          bounds.south <= coverageNorth &&
-          bounds.north >= coverageSouth) {
+      if (west <= box.east && east >= box.west && south <= box.north && north >= box.south) {
         return true;
       }
     }
@@ -669,13 +706,20 @@ class NwsWeatherProvider implements WeatherStationProvider {
   }
 
   /// Generate cache key from bounding box (rounded to 0.1 degrees)
-  String _getBoundsCacheKey(LatLngBounds bounds) {
-    final west = (bounds.west * 10).round() / 10;
-    final south = (bounds.south * 10).round() / 10;
-    final east = (bounds.east * 10).round() / 10;
-    final north = (bounds.north * 10).round() / 10;
+  /// Integer record rather than a formatted string - cheaper to build and hash
+  _BoundsCacheKey _getBoundsCacheKey(LatLngBounds bounds) {
+    return (
+      (bounds.west * 10).round(),
+      (bounds.south * 10).round(),
+      (bounds.east * 10).round(),
+      (bounds.north * 10).round(),
+    );
+  }
 
-    return '$west,$south,$east,$north';
+  /// Cache key edges in degrees (west,south,east,north) for logging
+  String _cacheKeyToString(_BoundsCacheKey key) {
+    final (west, south, east, north) = key;
+    return '${west / 10},${south / 10},${east / 10},${north / 10}';
   }
 
   /// Convert bounds to string for logging
@@ -702,6 +746,21 @@ class _StationCacheEntry {
   }
 }
 
+/// Cache entry for a /points lookup (null gridUrl = outside NWS coverage)
+class _GridUrlCacheEntry {
+  final String? gridUrl;
+  final DateTime timestamp;
+
+  _GridUrlCacheEntry({
+    required this.gridUrl,
+    required this.timestamp,
+  });
+
+  bool get isExpired {
+    return DateTime.now().difference(timestamp) > MapConstants.nwsStationListCacheTTL;
+  }
+}
+
 /// Cache entry for individual station observations with expiration
 class _ObservationCacheEntry {
   final WindData windData;
@@ -1,3 +1,4 @@
+import 'dart:async';
 import 'dart:convert';
 import 'package:http/http.dart' as http;
 import 'package:flutter_map/flutter_map.dart';
@@ -7,6 +8,8 @@ import '../../data/models/weather_station_source.dart';
 import '../../data/models/wind_data.dart';
 import '../../utils/map_constants.dart';
 import '../logging_service.dart';
+import 'weather_http_client.dart';
+import 'weather_response_disk_cache.dart';
 import 'weather_station_provider.dart';
 
 /// Pioupiou/OpenWindMap weather station provider from api.pioupiou.fr
@@ -27,6 +30,9 @@ class PioupiouWeatherProvider implements WeatherStationProvider {
   // Note: Pioupiou API does not support HTTPS, must use HTTP
   static const String _baseUrl = 'http://api.pioupiou.fr/v1';
 
+  /// Disk cache key for the raw live-with-meta response
+  static const String _stationListDiskCacheKey = 'pioupiou_live_with_meta';
+
   /// Global cache entry (single entry for all stations)
   _GlobalCacheEntry? _globalCache;
 
@@ -80,12 +86,10 @@ class PioupiouWeatherProvider implements WeatherStationProvider {
 
       // Step 1: Check if station list cache is valid (<24hr)
       if (_globalCache != null && !_globalCache!.stationListExpired) {
-        // Step 2: Check if ANY stations exist in current view
-        final hasStationsInView = _globalCache!.stations.any((s) =>
-          bounds.contains(LatLng(s.latitude, s.longitude))
-        );
+        // Step 2: Collect the stations in the current view
+        final stationsInView = _filterStationsToBounds(_globalCache!.stations, bounds);
 
-        if (!hasStationsInView) {
+        if (stationsInView.isEmpty) {
           // No stations to display - skip measurement refresh API call
           LoggingService.structured('PIOUPIOU_NO_STATIONS_IN_VIEW', {
             'bounds': '${bounds.south},${bounds.west},${bounds.north},${bounds.east}',
@@ -101,41 +105,34 @@ class PioupiouWeatherProvider implements WeatherStationProvider {
           LoggingService.info('Pioupiou measurements expired, refreshing');
           onApiCallStart?.call(); // Notify UI that API call is starting
           await _refreshMeasurements();
-        } else {
-          LoggingService.structured('PIOUPIOU_CACHE_HIT', {
-            'total_stations': _globalCache!.stations.length,
-            'station_list_age_min': DateTime.now()
-                .difference(_globalCache!.stationListTimestamp)
-                .inMinutes,
-            'measurements_age_min': DateTime.now()
-                .difference(_globalCache!.measurementsTimestamp)
-                .inMinutes,
-          });
+
+          // Step 4: Refresh replaced the station list - filter it again
+          return _filterStationsToBounds(_globalCache!.stations, bounds);
         }
 
-        // Step 4: Filter to bbox and return
-        return _filterStationsToBounds(_globalCache!.stations, bounds);
+        LoggingService.structured('PIOUPIOU_CACHE_HIT', {
+          'total_stations': _globalCache!.stations.length,
+          'station_list_age_min': DateTime.now()
+              .difference(_globalCache!.stationListTimestamp)
+              .inMinutes,
+          'measurements_age_min': DateTime.now()
+              .difference(_globalCache!.measurementsTimestamp)
+              .inMinutes,
+        });
+
+        // Step 4: Measurements are fresh - reuse the in-view pass
+        return stationsInView;
       }
 
       // Step 4: No valid cache - fetch everything from API
-      if (_pendingGlobalRequest != null) {
-        LoggingService.info('Waiting for pending Pioupiou global request');
-        await _pendingGlobalRequest;
-        return _filterStationsToBounds(_globalCache!.stations, bounds);
+      if (_pendingGlobalRequest == null) {
+        onApiCallStart?.call(); // Notify UI that API call is starting
       }
-
-      // Fetch all stations
-      onApiCallStart?.call(); // Notify UI that API call is starting
-      _pendingGlobalRequest = _fetchAllStations();
-      try {
-        await _pendingGlobalRequest;
-        if (_globalCache == null) {
-          return []; // Failed to fetch
-        }
-        return _filterStationsToBounds(_globalCache!.stations, bounds);
-      } finally {
-        _pendingGlobalRequest = null;
+      await _fetchAllStationsShared();
+      if (_globalCache == null) {
+        return []; // Failed to fetch
       }
+      return _filterStationsToBounds(_globalCache!.stations, bounds);
     } catch (e, stackTrace) {
       LoggingService.error('Failed to fetch Pioupiou stations', e, stackTrace);
       return [];
@@ -169,6 +166,7 @@ class PioupiouWeatherProvider implements WeatherStationProvider {
   void clearCache() {
     _globalCache = null;
     _pendingGlobalRequest = null;
+    unawaited(WeatherResponseDiskCache.instance.remove(_stationListDiskCacheKey));
     LoggingService.info('Pioupiou global cache cleared');
   }
 
@@ -195,12 +193,55 @@ class PioupiouWeatherProvider implements WeatherStationProvider {
     };
   }
 
+  /// Run _fetchAllStations, sharing one in-flight request between concurrent callers
+  ///
+  /// A first load and a measurement refresh (or two map moves) arriving
+  /// together would otherwise each download the full global payload.
+  Future<List<WeatherStation>> _fetchAllStationsShared() async {
+    final pending = _pendingGlobalRequest;
+    if (pending != null) {
+      LoggingService.info('Waiting for pending Pioupiou global request');
+      return pending;
+    }
+
+    final request = _fetchAllStations();
+    _pendingGlobalRequest = request;
+    try {
+      return await request;
+    } finally {
+      // clearCache() may have dropped or replaced the pending request
+      if (identical(_pendingGlobalRequest, request)) {
+        _pendingGlobalRequest = null;
+      }
+    }
+  }
+
   /// Fetch all stations from Pioupiou API
   /// Endpoint returns ~1000 stations globally with embedded measurements
   Future<List<WeatherStation>> _fetchAllStations() async {
     try {
       final stopwatch = Stopwatch()..start();
 
+      // Measurements are embedded in the station list, so a disk copy is only
+      // reused within the measurement TTL - enough to skip the download when
+      // the app is reopened shortly after the last fetch
+      final cached = await WeatherResponseDiskCache.instance.read(
+        _stationListDiskCacheKey,
+        MapConstants.pioupiouMeasurementsCacheTTL,
+      );
+      if (cached != null) {
+        final stations = _parseAndCacheStations(cached.body, cached.savedAt);
+        stopwatch.stop();
+
+        LoggingService.structured('PIOUPIOU_DISK_CACHE_HIT', {
+          'station_count': stations.length,
+          'age_min': DateTime.now().difference(cached.savedAt).inMinutes,
+          'total_ms': stopwatch.elapsedMilliseconds,
+        });
+
+        return stations;
+      }
+
       final url = Uri.parse('$_baseUrl/live-with-meta/all');
 
       LoggingService.structured('PIOUPIOU_REQUEST_START', {
@@ -208,23 +249,25 @@ class PioupiouWeatherProvider implements WeatherStationProvider {
         'strategy': 'fetch_all_global',
       });
 
-      final response = await http.get(
+      final response = await WeatherHttpClient.withHostSlot(
         url,
-        headers: {
-          'Accept': 'application/json',
-          'User-Agent': 'TheParaglidingApp/1.0',
-        },
-      ).timeout(
-        const Duration(seconds: 30),
-        onTimeout: () {
-          stopwatch.stop();
-          LoggingService.structured('PIOUPIOU_TIMEOUT', {
-            'url': url.toString(),
-            'duration_ms': stopwatch.elapsedMilliseconds,
-            'timeout_seconds': 30,
-          });
-          return http.Response('{"error": "Request timeout"}', 408);
-        },
+        () => WeatherHttpClient.client.get(
+          url,
+          headers: {
+            'Accept': 'application/json',
+          },
+        ).timeout(
+          const Duration(seconds: 30),
+          onTimeout: () {
+            stopwatch.stop();
+            LoggingService.structured('PIOUPIOU_TIMEOUT', {
+              'url': url.toString(),
+              'duration_ms': stopwatch.elapsedMilliseconds,
+              'timeout_seconds': 30,
+            });
+            return http.Response('{"error": "Request timeout"}', 408);
+          },
+        ),
       );
 
       stopwatch.stop();
@@ -240,21 +283,7 @@ class PioupiouWeatherProvider implements WeatherStationProvider {
 
         // Parse response
         final parseStopwatch = Stopwatch()..start();
-        final Map<String, dynamic> responseJson = jsonDecode(response.body);
-        final List<dynamic> dataList = responseJson['data'] as List? ?? [];
-        final List<WeatherStation> stations = [];
-
-        for (final stationJson in dataList) {
-          try {
-            final station = _parsePioupiouStation(stationJson as Map<String, dynamic>);
-            if (station != null) {
-              stations.add(station);
-            }
-          } catch (e) {
-            LoggingService.error('Failed to parse Pioupiou station', e);
-          }
-        }
-
+        final stations = _parseAndCacheStations(response.body, DateTime.now());
         parseStopwatch.stop();
 
         LoggingService.performance(
@@ -263,24 +292,11 @@ class PioupiouWeatherProvider implements WeatherStationProvider {
           '${stations.length} stations parsed',
         );
 
-        // Calculate bounding box from fetched stations
-        final cachedBounds = _calculateBoundsFromStations(stations);
-
-        // Cache the results with current timestamps and calculated bbox
-        final now = DateTime.now();
-        _globalCache = _GlobalCacheEntry(
-          stations: stations,
-          stationListTimestamp: now,
-          measurementsTimestamp: now,
-          bounds: cachedBounds,
-        );
-
-        LoggingService.structured('PIOUPIOU_BBOX_CALCULATED', {
-          'station_count': stations.length,
-          'bounds': '${cachedBounds.south},${cachedBounds.west},${cachedBounds.north},${cachedBounds.east}',
-          'bounds_width_degrees': (cachedBounds.east - cachedBounds.west).toStringAsFixed(2),
-          'bounds_height_degrees': (cachedBounds.north - cachedBounds.south).toStringAsFixed(2),
-        });
+        // Only persist a body that parsed as a station list
+        unawaited(WeatherResponseDiskCache.instance.write(
+          _stationListDiskCacheKey,
+          response.body,
+        ));
 
         LoggingService.structured('PIOUPIOU_STATIONS_SUCCESS', {
           'station_count': stations.length,
@@ -315,11 +331,51 @@ class PioupiouWeatherProvider implements WeatherStationProvider {
     }
   }
 
+  /// Parse a live-with-meta response body and replace the global cache
+  /// [fetchedAt] is when the body was downloaded, so a body read back from
+  /// disk keeps its real age for TTL checks
+  List<WeatherStation> _parseAndCacheStations(String body, DateTime fetchedAt) {
+    final Map<String, dynamic> responseJson = jsonDecode(body);
+    final List<dynamic> dataList = responseJson['data'] as List? ?? [];
+    final List<WeatherStation> stations = [];
+
+    for (final stationJson in dataList) {
+      try {
+        final station = _parsePioupiouStation(stationJson as Map<String, dynamic>);
+        if (station != null) {
+          stations.add(station);
+        }
+      } catch (e) {
+        LoggingService.error('Failed to parse Pioupiou station', e);
+      }
+    }
+
+    // Calculate bounding box from fetched stations
+    final cachedBounds = _calculateBoundsFromStations(stations);
+
+    // Cache the results with fetch timestamps and calculated bbox
+    _globalCache = _GlobalCacheEntry(
+      stations: stations,
+      stationListTimestamp: fetchedAt,
+      measurementsTimestamp: fetchedAt,
+      bounds: cachedBounds,
+    );
+
+    LoggingService.structured('PIOUPIOU_BBOX_CALCULATED', {
+      'station_count': stations.length,
+      'bounds': '${cachedBounds.south},${cachedBounds.west},${cachedBounds.north},${cachedBounds.east}',
+      'bounds_width_degrees': (cachedBounds.east - cachedBounds.west).toStringAsFixed(2),
+      'bounds_height_degrees': (cachedBounds.north - cachedBounds.south).toStringAsFixed(2),
+    });
+
+    return stations;
+  }
+
   /// Refresh measurements while keeping station list cache
   /// Re-fetches all stations but only updates measurements timestamp
   Future<void> _refreshMeasurements() async {
     try {
-      final stations = await _fetchAllStations();
+      final stations = await _fetchAllStationsShared();
       if (stations.isNotEmpty && _globalCache != null) {
         // Recalculate bbox from refreshed stations
         final refreshedBounds = _calculateBoundsFromStations(stations);
@@ -408,9 +464,20 @@ class PioupiouWeatherProvider implements WeatherStationProvider {
     List<WeatherStation> stations,
     LatLngBounds bounds,
   ) {
-    final filtered = stations.where((station) {
-      return bounds.contains(LatLng(station.latitude, station.longitude));
-    }).toList();
+    // Compare raw coordinates rather than building a LatLng per station
+    final south = bounds.south;
+    final north = bounds.north;
+    final west = bounds.west;
+    final east = bounds.east;
+
+    final filtered = <WeatherStation>[];
+    for (final station in stations) {
+      final lat = station.latitude;
+      final lon = station.longitude;
+      if (lat >= south && lat <= north && lon >= west && lon <= east) {
+        filtered.add(station);
+      }
+    }
 
     LoggingService.structured('PIOUPIOU_BBOX_FILTER', {
       'total_stations': stations.length,
@@ -0,0 +1,149 @@
+import 'dart:async';
+import 'dart:collection';
+import 'dart:convert';
+import 'package:http/http.dart' as http;
+import 'package:http/retry.dart';
+
+/// Shared HTTP client for all weather station providers
+///
+/// Top-level `http.get()` creates and closes a client per call, so every
+/// request paid a fresh TCP + TLS handshake. A single persistent client keeps
+/// connections alive across providers and between NWS's dependent
+/// `/points` -> `observationStations` requests to api.weather.gov.
+///
+/// Requests run through [withHostSlot], which caps concurrent requests per
+/// host, and rate-limit responses (429/403) are retried with exponential
+/// backoff, so fan-outs such as NWS's one request per station degrade
+/// gracefully instead of tripping provider limits.
+///
+/// Response compression needs no setup here: dart:io's client sends
+/// `Accept-Encoding: gzip` and inflates bodies before they reach the response
+/// stream, and on web the browser negotiates gzip/brotli itself. Don't
+/// advertise `br` by hand: dart:io has no brotli decoder.
+class WeatherHttpClient {
+  WeatherHttpClient._();
+
+  /// Maximum concurrent requests to a single host
+  static const int maxRequestsPerHost = 6;
+
+  /// Retries after the first attempt for rate-limited responses
+  static const int _maxRetries = 2;
+
+  /// User-Agent sent with every request that doesn't set its own
+  static const String userAgent = 'TheParaglidingApp/1.0';
+
+  static final http.Client client = RetryClient(
+    _UserAgentClient(http.Client()),
+    retries: _maxRetries,
+    when: (response) => response.statusCode == 429 || response.statusCode == 403,
+    delay: (retryCount) => Duration(seconds: 1 << retryCount), // 1s, 2s
+  );
+
+  static final HostRequestLimiter _limiter = HostRequestLimiter(maxRequestsPerHost);
+
+  /// Run [request] once a slot for [url]'s host is free
+  ///
+  /// Apply the request's timeout inside [request], so it only starts counting
+  /// once the request is actually sent - a request queued behind a large
+  /// fan-out must not time out before it reaches the network.
+  static Future<T> withHostSlot<T>(Uri url, Future<T> Function() request) {
+    return _limiter.run(url.host, request);
+  }
+
+  /// UTF-8 decoder fused with the JSON parser, so bytes are parsed directly
+  /// without first being assembled into a body String
+  static final Converter<List<int>, Object?> _jsonUtf8Decoder =
+      utf8.decoder.fuse(json.decoder);
+
+  /// Parse a buffered JSON response body straight from its bytes
+  ///
+  /// JSON is always UTF-8, so this skips `Response.body`'s charset lookup and
+  /// the intermediate String that `jsonDecode(response.body)` builds.
+  static Object? decodeJson(List<int> bodyBytes) => _jsonUtf8Decoder.convert(bodyBytes);
+
+  /// GET a JSON resource, parsing the body incrementally as chunks arrive
+  ///
+  /// Unlike `client.get()`, neither the raw bytes nor the decoded String of a
+  /// large response are held in memory alongside the parsed result.
+  /// [json] is only set for a 200 response; other bodies are discarded.
+  static Future<({int statusCode, Object? json})> getJson(
+    Uri url, {
+    Map<String, String>? headers,
+  }) async {
+    final request = http.Request('GET', url);
+    if (headers != null) request.headers.addAll(headers);
+
+    final response = await client.send(request);
+    if (response.statusCode != 200) {
+      await response.stream.drain<void>();
+      return (statusCode: response.statusCode, json: null);
+    }
+
+    final decoded = await response.stream.transform(_jsonUtf8Decoder).single;
+    return (statusCode: response.statusCode, json: decoded);
+  }
+}
+
+/// Client that sets the default User-Agent
+class _UserAgentClient extends http.BaseClient {
+  _UserAgentClient(this._inner);
+
+  final http.Client _inner;
+
+  @override
+  Future<http.StreamedResponse> send(http.BaseRequest request) {
+    request.headers.putIfAbsent('User-Agent', () => WeatherHttpClient.userAgent);
+    return _inner.send(request);
+  }
+
+  @override
+  void close() => _inner.close();
+}
+
+/// Caps the number of requests in flight to each host
+///
+/// Requests beyond the cap wait in FIFO order. A slot is held until the
+/// request's future completes - including by timing out or throwing.
+class HostRequestLimiter {
+  HostRequestLimiter(this.maxPerHost);
+
+  final int maxPerHost;
+  final Map<String, _HostSlots> _hosts = {};
+
+  Future<T> run<T>(String host, Future<T> Function() request) async {
+    final slots = _hosts.putIfAbsent(host, () => _HostSlots(maxPerHost));
+    await slots.acquire();
+    try {
+      return await request();
+    } finally {
+      slots.release();
+    }
+  }
+}
+
+/// Counting semaphore for one host's request slots
+class _HostSlots {
+  _HostSlots(this._available);
+
+  int _available;
+  final Queue<Completer<void>> _waiters = Queue();
+
+  Future<void> acquire() {
+    if (_available > 0) {
+      _available--;
+      return Future.value();
+    }
+    final waiter = Completer<void>();
+    _waiters.add(waiter);
+    return waiter.future;
+  }
+
+  void release() {
+    if (_waiters.isNotEmpty) {
+      // Hand the slot straight to the next waiter
+      _waiters.removeFirst().complete();
+    } else {
+      _available++;
+    }
+  }
+}
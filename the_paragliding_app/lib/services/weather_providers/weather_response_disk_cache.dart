@@ -0,0 +1,95 @@
+import 'dart:io';
+import 'package:flutter/foundation.dart' show visibleForTesting;
+import 'package:path/path.dart' as p;
+import 'package:path_provider/path_provider.dart';
+import '../logging_service.dart';
+
+/// On-disk cache for raw weather provider response bodies
+///
+/// Provider caches are in-memory only, so the large global payloads (FFVL
+/// beacon list, Pioupiou station list) were downloaded again on every app
+/// launch. Entries are plain files in the app cache directory and expire by
+/// file modification time - the OS may also evict them at any point, which
+/// is just a cache miss.
+class WeatherResponseDiskCache {
+  static final WeatherResponseDiskCache instance = WeatherResponseDiskCache._();
+  WeatherResponseDiskCache._();
+
+  /// Cache rooted at [directory] instead of the app cache directory, so tests
+  /// need no path_provider plugin
+  @visibleForTesting
+  WeatherResponseDiskCache.forDirectory(Directory directory) : _directory = directory;
+
+  static const String _directoryName = 'weather_stations';
+
+  Directory? _directory;
+
+  /// When each key was last removed. Entries saved before this are ignored
+  /// even if the file is still on disk: callers remove without awaiting and
+  /// fetch straight away, and a write that was already in flight can land
+  /// after the delete
+  final Map<String, DateTime> _removedAt = {};
+
+  Future<Directory> _cacheDirectory() async {
+    if (_directory != null) return _directory!;
+    final cacheDir = await getApplicationCacheDirectory();
+    final dir = Directory(p.join(cacheDir.path, _directoryName));
+    await dir.create(recursive: true);
+    _directory = dir;
+    return dir;
+  }
+
+  Future<File> _file(String key) async {
+    final dir = await _cacheDirectory();
+    return File(p.join(dir.path, '$key.json'));
+  }
+
+  /// Read a cached body if it was saved less than [ttl] ago
+  /// Returns null on a miss, an expired entry, or any I/O failure
+  Future<({String body, DateTime savedAt})?> read(String key, Duration ttl) async {
+    try {
+      final file = await _file(key);
+      if (!await file.exists()) return null;
+
+      final savedAt = await file.lastModified();
+      if (DateTime.now().difference(savedAt) > ttl) return null;
+
+      final removedAt = _removedAt[key];
+      if (removedAt != null && !savedAt.isAfter(removedAt)) return null;
+
+      return (body: await file.readAsString(), savedAt: savedAt);
+    } catch (e) {
+      LoggingService.error('Failed to read weather disk cache: $key', e);
+      return null;
+    }
+  }
+
+  /// Save a response body, replacing any previous entry
+  /// Written to a temp file then renamed so a reader never sees a partial body
+  Future<void> write(String key, String body) async {
+    try {
+      final file = await _file(key);
+      final temp = File('${file.path}.tmp');
+      await temp.writeAsString(body, flush: true);
+      await temp.rename(file.path);
+    } catch (e) {
+      LoggingService.error('Failed to write weather disk cache: $key', e);
+    }
+  }
+
+  /// Delete a cached entry
+  /// The entry stops being served immediately, before the file is deleted
+  Future<void> remove(String key) async {
+    // Recorded before the first await so a read that starts right after an
+    // unawaited remove() already misses
+    _removedAt[key] = DateTime.now();
+    try {
+      final file = await _file(key);
+      if (await file.exists()) {
+        await file.delete();
+      }
+    } catch (e) {
+      LoggingService.error('Failed to remove weather disk cache: $key', e);
+    }
+  }
+}
@@ -1,10 +1,13 @@
 import 'dart:async';
+import 'dart:math' as math;
+import 'dart:typed_data';
+import 'package:flutter/foundation.dart' show visibleForTesting;
 import 'package:flutter_map/flutter_map.dart';
-import 'package:latlong2/latlong.dart';
 import 'package:shared_preferences/shared_preferences.dart';
 import '../data/models/weather_station.dart';
 import '../data/models/weather_station_source.dart';
 import '../data/models/wind_data.dart';
+import '../utils/map_calculation_utils.dart';
 import 'logging_service.dart';
 import 'weather_providers/weather_station_provider.dart';
 import 'weather_providers/weather_station_provider_registry.dart';
@@ -33,6 +36,11 @@ class WeatherStationService {
   /// Increased to 150m to handle coordinate precision differences between providers
   static const double _deduplicationDistanceMeters = 150.0;
 
+  /// Latitude span (degrees) of the deduplication threshold
+  /// Stations further apart in latitude than this can't be duplicates
+  static const double _deduplicationLatDelta =
+      _deduplicationDistanceMeters / MapCalculationUtils.earthRadiusMeters * (180 / math.pi);
+
   /// Get weather stations in a bounding box from all enabled providers
   /// Fetches in parallel, then deduplicates and returns combined results
   /// Optional [onProgress] callback reports each provider's completion
@@ -74,7 +82,7 @@ class WeatherStationService {
                 ? () {
                     // Provider is notifying that it's making an API call
                     providersWithApiCalls.add(provider.source); // Track that this provider made an API call
-                    final deduplicatedSoFar = _deduplicateStations(allStations);
+                    final deduplicatedSoFar = deduplicateStations(allStations);
                     onProgress.call(
                       source: provider.source,
                       displayName: provider.displayName,
@@ -92,7 +100,7 @@ class WeatherStationService {
 
           // Add to running total and deduplicate
           allStations.addAll(stations);
-          final deduplicatedSoFar = _deduplicateStations(allStations);
+          final deduplicatedSoFar = deduplicateStations(allStations);
 
           // Only report progress if:
           // 1. Provider returned stations (stationCount > 0), OR
@@ -118,7 +126,7 @@ class WeatherStationService {
           // This prevents providers that error before API calls from showing in overlay
           if (providersWithApiCalls.contains(provider.source)) {
             // Report error with current stations (no new ones from this provider)
-            final deduplicatedSoFar = _deduplicateStations(allStations);
+            final deduplicatedSoFar = deduplicateStations(allStations);
             onProgress?.call(
               source: provider.source,
               displayName: provider.displayName,
@@ -167,7 +175,7 @@ class WeatherStationService {
 
       // Deduplicate stations
       final dedupStopwatch = Stopwatch()..start();
-      final deduplicatedStations = _deduplicateStations(allStations);
+      final deduplicatedStations = deduplicateStations(allStations);
       dedupStopwatch.stop();
 
       LoggingService.performance(
@@ -231,38 +239,71 @@ class WeatherStationService {
 
   /// Deduplicate stations from multiple providers
   /// Keeps station with newest data when duplicates found within threshold distance
-  List<WeatherStation> _deduplicateStations(List<WeatherStation> stations) {
+  @visibleForTesting
+  List<WeatherStation> deduplicateStations(List<WeatherStation> stations) {
     if (stations.length <= 1) return stations;
 
     final result = <WeatherStation>[];
     final discarded = <WeatherStation>[];
 
+    // Coordinates of the kept stations, parallel to result, so the inner
+    // scan reads contiguous doubles instead of chasing each station object
+    final keptLats = Float64List(stations.length);
+    final keptLons = Float64List(stations.length);
+
     for (final station in stations) {
+      final stationLat = station.latitude;
+      final stationLon = station.longitude;
+
+      // Degree-box pre-check so the haversine only runs for nearby pairs.
+      // Longitude span uses the highest latitude the pair could share, so
+      // the box never excludes a real duplicate
+      final maxAbsLat = stationLat.abs() + _deduplicationLatDelta;
+      final lonDelta = maxAbsLat >= 90
+          ? 180.0
+          : _deduplicationLatDelta / math.cos(maxAbsLat * (math.pi / 180));
+
+      // Latitude terms of the haversine are fixed for this station
+      final stationLatRad = stationLat * (math.pi / 180);
+      final cosStationLat = math.cos(stationLatRad);
+
       // Check if this station is a duplicate of any in result
-      WeatherStation? duplicate;
-
-      for (final existing in result) {
-        final distance = _calculateDistance(
-          station.latitude,
-          station.longitude,
-          existing.latitude,
-          existing.longitude,
+      var duplicateIndex = -1;
+
+      for (var i = 0; i < result.length; i++) {
+        final existingLat = keptLats[i];
+        if ((stationLat - existingLat).abs() > _deduplicationLatDelta) {
+          continue;
+        }
+        final existingLon = keptLons[i];
+        var lonDiff = (stationLon - existingLon).abs();
+        if (lonDiff > 180) lonDiff = 360 - lonDiff; // Across the antimeridian
+        if (lonDiff > lonDelta) continue;
+
+        final distance = MapCalculationUtils.haversineDistanceFrom(
+          stationLatRad,
+          cosStationLat,
+          stationLon,
+          existingLat,
+          existingLon,
         );
 
         if (distance <= _deduplicationDistanceMeters) {
-          duplicate = existing;
+          duplicateIndex = i;
           break;
         }
       }
 
-      if (duplicate != null) {
+      if (duplicateIndex >= 0) {
         // Found a duplicate - decide which to keep
+        final duplicate = result[duplicateIndex];
         final shouldReplace = _shouldReplaceStation(duplicate, station);
 
         if (shouldReplace) {
-          // Replace existing with new station
-          result.remove(duplicate);
-          result.add(station);
+          // Replace existing with new station in place
+          result[duplicateIndex] = station;
+          keptLats[duplicateIndex] = stationLat;
+          keptLons[duplicateIndex] = stationLon;
           discarded.add(duplicate);
         } else {
           // Keep existing, discard new
@@ -270,6 +311,8 @@ class WeatherStationService {
         }
       } else {
         // No duplicate found, add to result
+        keptLats[result.length] = stationLat;
+        keptLons[result.length] = stationLon;
         result.add(station);
       }
     }
@@ -313,12 +356,6 @@ class WeatherStationService {
     return false;
   }
 
-  /// Calculate distance between two lat/lon points in meters
-  double _calculateDistance(double lat1, double lon1, double lat2, double lon2) {
-    const distance = Distance();
-    return distance.distance(LatLng(lat1, lon1), LatLng(lat2, lon2));
-  }
-
   /// Get list of enabled providers based on preferences
   Future<List<WeatherStationProvider>> _getEnabledProviders() async {
     try {
@@ -13,14 +13,39 @@ class MapCalculationUtils {
   /// Calculate distance between two LatLng points using Haversine formula
   /// Returns distance in meters
   static double haversineDistance(LatLng point1, LatLng point2) {
-    final lat1Rad = point1.latitude * (math.pi / 180);
-    final lat2Rad = point2.latitude * (math.pi / 180);
-    final deltaLat = (point2.latitude - point1.latitude) * (math.pi / 180);
-    final deltaLng = (point2.longitude - point1.longitude) * (math.pi / 180);
+    return haversineDistanceDegrees(
+      point1.latitude, point1.longitude,
+      point2.latitude, point2.longitude,
+    );
+  }
+
+  /// Haversine distance between two raw lat/lon pairs in degrees
+  /// Avoids allocating LatLng objects in hot loops (e.g. station deduplication)
+  /// Returns distance in meters
+  ///
+  /// Marked for inlining: callers run it inside tight per-station loops, where
+  /// the call overhead is a noticeable share of a few trig operations
+  @pragma('vm:prefer-inline')
+  static double haversineDistanceDegrees(double lat1, double lng1, double lat2, double lng2) {
+    final lat1Rad = lat1 * (math.pi / 180);
+    return haversineDistanceFrom(lat1Rad, math.cos(lat1Rad), lng1, lat2, lng2);
+  }
 
-    final a = math.sin(deltaLat / 2) * math.sin(deltaLat / 2) +
-        math.cos(lat1Rad) * math.cos(lat2Rad) *
-        math.sin(deltaLng / 2) * math.sin(deltaLng / 2);
+  /// Haversine distance from an origin whose latitude terms are precomputed
+  /// When one point is fixed across many comparisons, compute [lat1Rad] and
+  /// [cosLat1] once per origin instead of once per pair
+  /// Longitudes and [lat2] are in degrees; returns distance in meters
+  @pragma('vm:prefer-inline')
+  static double haversineDistanceFrom(
+    double lat1Rad, double cosLat1, double lng1, double lat2, double lng2,
+  ) {
+    final lat2Rad = lat2 * (math.pi / 180);
+    final sinHalfDeltaLat = math.sin((lat2Rad - lat1Rad) / 2);
+    final sinHalfDeltaLng = math.sin((lng2 - lng1) * (math.pi / 180) / 2);
+
+    final a = sinHalfDeltaLat * sinHalfDeltaLat +
+        cosLat1 * math.cos(lat2Rad) *
+        sinHalfDeltaLng * sinHalfDeltaLng;
     final c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a));
 
     return earthRadiusMeters * c;
@@ -0,0 +1,46 @@
+import 'dart:math' as math;
+import 'package:flutter_test/flutter_test.dart';
+import 'package:latlong2/latlong.dart';
+import 'package:the_paragliding_app/utils/map_calculation_utils.dart';
+
+void main() {
+  group('MapCalculationUtils.haversineDistanceDegrees', () {
+    test('matches the LatLng overload', () {
+      const a = LatLng(45.9237, 6.8694); // Chamonix
+      const b = LatLng(45.8326, 6.8652); // Mont Blanc summit
+
+      expect(
+        MapCalculationUtils.haversineDistanceDegrees(
+          a.latitude, a.longitude, b.latitude, b.longitude,
+        ),
+        MapCalculationUtils.haversineDistance(a, b),
+      );
+    });
+
+    test('one degree of latitude is ~111km', () {
+      final distance = MapCalculationUtils.haversineDistanceDegrees(45.0, 6.0, 46.0, 6.0);
+
+      expect(distance, closeTo(111195, 10));
+    });
+
+    test('identical points are zero distance', () {
+      expect(MapCalculationUtils.haversineDistanceDegrees(-33.5, 151.2, -33.5, 151.2), 0.0);
+    });
+  });
+
+  group('MapCalculationUtils.haversineDistanceFrom', () {
+    test('matches haversineDistanceDegrees with precomputed origin terms', () {
+      const originLat = 47.3;
+      const originLng = 8.5;
+      final originLatRad = originLat * (math.pi / 180);
+      final cosOriginLat = math.cos(originLatRad);
+
+      for (final (lat, lng) in [(47.31, 8.52), (46.0, 7.0), (-33.9, 151.2)]) {
+        expect(
+          MapCalculationUtils.haversineDistanceFrom(originLatRad, cosOriginLat, originLng, lat, lng),
+          closeTo(MapCalculationUtils.haversineDistanceDegrees(originLat, originLng, lat, lng), 1e-6),
+        );
+      }
+    });
+  });
+}
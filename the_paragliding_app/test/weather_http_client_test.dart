@@ -0,0 +1,132 @@
+import 'dart:async';
+
+import 'package:flutter_test/flutter_test.dart';
+import 'package:http/http.dart' as http;
+import 'package:http/testing.dart';
+import 'package:the_paragliding_app/services/weather_providers/weather_http_client.dart';
+
+/// The per-host cap keeps NWS's one-request-per-station fan-out from opening
+/// dozens of connections at once. Queued requests must still reach the
+/// network in order, free their slot however they finish, and only start
+/// their timeout once they are actually sent.
+void main() {
+  const host = 'api.weather.gov';
+
+  Uri stationUrl(String id) => Uri.https(host, '/stations/$id/observations/latest');
+
+  /// Holds each request open until the test completes its gate, recording the
+  /// order requests reached the network.
+  late List<String> sent;
+  late Map<String, Completer<http.Response>> gates;
+  late MockClient client;
+
+  setUp(() {
+    sent = [];
+    gates = {};
+    client = MockClient((request) {
+      final id = request.url.pathSegments[1];
+      sent.add(id);
+      return gates.putIfAbsent(id, Completer.new).future;
+    });
+  });
+
+  Future<http.Response> get(HostRequestLimiter limiter, String id) {
+    final url = stationUrl(id);
+    return limiter.run(url.host, () => client.get(url));
+  }
+
+  void respond(String id) => gates.putIfAbsent(id, Completer.new).complete(http.Response('{}', 200));
+
+  /// Let queued hand-offs and MockClient's async plumbing run
+  Future<void> settle() => Future<void>.delayed(Duration.zero);
+
+  group('HostRequestLimiter', () {
+    test('sends at most maxPerHost requests to a host at once', () async {
+      final limiter = HostRequestLimiter(2);
+
+      final responses = [for (final id in ['a', 'b', 'c', 'd']) get(limiter, id)];
+      await settle();
+      expect(sent, ['a', 'b']);
+
+      respond('a');
+      await settle();
+      expect(sent, ['a', 'b', 'c']);
+
+      respond('b');
+      respond('c');
+      respond('d');
+      await Future.wait(responses);
+      expect(sent, ['a', 'b', 'c', 'd']);
+    });
+
+    test('hands freed slots to waiters in FIFO order', () async {
+      final limiter = HostRequestLimiter(1);
+
+      final responses = [for (final id in ['a', 'b', 'c', 'd']) get(limiter, id)];
+      await settle();
+
+      // Each freed slot goes to the longest-waiting request, one at a time
+      for (final id in ['a', 'b', 'c', 'd']) {
+        expect(sent.last, id);
+        respond(id);
+        await settle();
+      }
+      await Future.wait(responses);
+
+      expect(sent, ['a', 'b', 'c', 'd']);
+    });
+
+    test('releases the slot when the request throws', () async {
+      final limiter = HostRequestLimiter(1);
+      final failingUrl = stationUrl('broken');
+
+      final failing = limiter.run(
+        failingUrl.host,
+        () => MockClient((_) async => throw http.ClientException('connection reset'))
+            .get(failingUrl),
+      );
+      final next = get(limiter, 'a');
+
+      await expectLater(failing, throwsA(isA<http.ClientException>()));
+      await settle();
+      expect(sent, ['a']);
+
+      respond('a');
+      expect((await next).statusCode, 200);
+    });
+
+    test('a queued request\'s timeout starts only once it is sent', () async {
+      final limiter = HostRequestLimiter(1);
+      final blocker = get(limiter, 'blocker');
+      final url = stationUrl('queued');
+
+      // Queued longer than its own timeout, but answered immediately once sent
+      final queued = limiter.run(
+        url.host,
+        () => client.get(url).timeout(const Duration(milliseconds: 100)),
+      );
+      respond('queued');
+
+      await Future<void>.delayed(const Duration(milliseconds: 250));
+      respond('blocker');
+
+      await blocker;
+      expect((await queued).statusCode, 200);
+    });
+
+    test('does not share slots between hosts', () async {
+      final limiter = HostRequestLimiter(1);
+      final otherUrl = Uri.https('aviationweather.gov', '/stations/other/x');
+
+      final first = get(limiter, 'a');
+      final other = limiter.run(otherUrl.host, () => client.get(otherUrl));
+      await settle();
+
+      expect(sent, unorderedEquals(['a', 'other']));
+
+      respond('a');
+      respond('other');
+      await Future.wait([first, other]);
+    });
+  });
+}
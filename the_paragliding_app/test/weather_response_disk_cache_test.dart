@@ -0,0 +1,98 @@
+import 'dart:io';
+
+import 'package:flutter_test/flutter_test.dart';
+import 'package:path/path.dart' as p;
+import 'package:the_paragliding_app/services/weather_providers/weather_response_disk_cache.dart';
+
+void main() {
+  late Directory directory;
+  late WeatherResponseDiskCache cache;
+
+  const key = 'pioupiou_live_with_meta';
+  const ttl = Duration(minutes: 20);
+
+  File entryFile() => File(p.join(directory.path, '$key.json'));
+
+  setUp(() async {
+    directory = await Directory.systemTemp.createTemp('weather_disk_cache_test');
+    cache = WeatherResponseDiskCache.forDirectory(directory);
+  });
+
+  tearDown(() async {
+    if (await directory.exists()) {
+      await directory.delete(recursive: true);
+    }
+  });
+
+  group('WeatherResponseDiskCache', () {
+    test('reads back a body written within the TTL', () async {
+      await cache.write(key, '{"data":[]}');
+
+      final entry = await cache.read(key, ttl);
+
+      expect(entry, isNotNull);
+      expect(entry!.body, '{"data":[]}');
+    });
+
+    test('misses once the entry is older than the TTL', () async {
+      await cache.write(key, '{"data":[]}');
+      await entryFile().setLastModified(DateTime.now().subtract(ttl * 2));
+
+      expect(await cache.read(key, ttl), isNull);
+    });
+
+    test('write replaces the entry via rename and leaves no temp file', () async {
+      await cache.write(key, 'first');
+      await cache.write(key, 'second');
+
+      expect((await cache.read(key, ttl))!.body, 'second');
+      expect(await File('${entryFile().path}.tmp').exists(), isFalse);
+      expect(directory.listSync().map((e) => p.basename(e.path)), ['$key.json']);
+    });
+
+    test('misses after remove', () async {
+      await cache.write(key, '{"data":[]}');
+      await cache.remove(key);
+
+      expect(await entryFile().exists(), isFalse);
+      expect(await cache.read(key, ttl), isNull);
+    });
+
+    test('misses straight after an unawaited remove', () async {
+      await cache.write(key, '{"data":[]}');
+
+      // Refresh-all calls clearCache() and fetches without waiting for the
+      // delete, so the file can still be on disk when the read runs
+      final removal = cache.remove(key);
+      final entry = await cache.read(key, ttl);
+      await removal;
+
+      expect(entry, isNull);
+    });
+
+    test('ignores an entry saved before remove that lands afterwards', () async {
+      await cache.remove(key);
+
+      // A write that was in flight during remove() and renamed into place
+      // after the delete - its body predates the clear
+      await entryFile().writeAsString('stale');
+      await entryFile().setLastModified(DateTime.now().subtract(const Duration(seconds: 5)));
+
+      expect(await cache.read(key, ttl), isNull);
+    });
+
+    test('serves entries written after remove', () async {
+      await cache.remove(key);
+
+      // Step past file timestamp granularity so the new entry is strictly later
+      await Future<void>.delayed(const Duration(milliseconds: 1100));
+      await cache.write(key, 'fresh');
+
+      expect((await cache.read(key, ttl))!.body, 'fresh');
+    });
+
+    test('misses when nothing was written', () async {
+      expect(await cache.read(key, ttl), isNull);
+    });
+  });
+}
@@ -0,0 +1,103 @@
+import 'package:flutter_test/flutter_test.dart';
+import 'package:the_paragliding_app/data/models/wind_data.dart';
+import 'package:the_paragliding_app/data/models/weather_station.dart';
+import 'package:the_paragliding_app/data/models/weather_station_source.dart';
+import 'package:the_paragliding_app/services/weather_station_service.dart';
+
+/// Stations from different providers within 150m are merged. The degree-box
+/// prefilter in front of the haversine must never skip a real duplicate -
+/// across the antimeridian and near the poles included.
+void main() {
+  final service = WeatherStationService.instance;
+
+  /// Degrees of latitude per metre on the haversine sphere (R = 6371km)
+  const degreesPerMeter = 1 / 111194.93;
+
+  WeatherStation station(String id, double lat, double lon,
+      {WeatherStationSource source = WeatherStationSource.awcMetar, DateTime? observedAt}) {
+    return WeatherStation(
+      id: id,
+      source: source,
+      latitude: lat,
+      longitude: lon,
+      windData: observedAt == null
+          ? null
+          : WindData(speedKmh: 10, directionDegrees: 270, timestamp: observedAt),
+    );
+  }
+
+  group('WeatherStationService.deduplicateStations', () {
+    test('merges a pair 100m apart across the antimeridian', () {
+      final halfGap = 50 * degreesPerMeter; // At the equator 1m of lon == 1m of lat
+      final result = service.deduplicateStations([
+        station('east', 0.0, 180 - halfGap),
+        station('west', 0.0, -180 + halfGap, source: WeatherStationSource.nws),
+      ]);
+
+      expect(result.map((s) => s.id), ['east']);
+    });
+
+    test('keeps a pair 1km apart across the antimeridian', () {
+      final halfGap = 500 * degreesPerMeter;
+      final result = service.deduplicateStations([
+        station('east', 0.0, 180 - halfGap),
+        station('west', 0.0, -180 + halfGap, source: WeatherStationSource.nws),
+      ]);
+
+      expect(result, hasLength(2));
+    });
+
+    test('merges a pair at 89.9 degrees that is far apart in longitude', () {
+      // 0.5 degrees of longitude is ~97m at 89.9 degrees
+      final result = service.deduplicateStations([
+        station('a', 89.9, 10.0),
+        station('b', 89.9, 10.5, source: WeatherStationSource.nws),
+      ]);
+
+      expect(result.map((s) => s.id), ['a']);
+    });
+
+    test('merges a pair either side of the pole where the box spans all longitudes', () {
+      // ~56m from the pole, 90 degrees apart: ~79m between them
+      final result = service.deduplicateStations([
+        station('a', 89.9995, 0.0),
+        station('b', 89.9995, 90.0, source: WeatherStationSource.nws),
+      ]);
+
+      expect(result.map((s) => s.id), ['a']);
+    });
+
+    test('keeps a pair just outside 150m', () {
+      final result = service.deduplicateStations([
+        station('a', 45.0, 6.0),
+        station('b', 45.0 + 151 * degreesPerMeter, 6.0, source: WeatherStationSource.nws),
+      ]);
+
+      expect(result, hasLength(2));
+    });
+
+    test('merges a pair just inside 150m', () {
+      final result = service.deduplicateStations([
+        station('a', 45.0, 6.0),
+        station('b', 45.0 + 149 * degreesPerMeter, 6.0, source: WeatherStationSource.nws),
+      ]);
+
+      expect(result.map((s) => s.id), ['a']);
+    });
+
+    test('a newer duplicate replaces the kept station and its coordinates', () {
+      final observedAt = DateTime.utc(2025, 6, 1, 12);
+      final result = service.deduplicateStations([
+        station('old', 45.0, 6.0, observedAt: observedAt),
+        // 100m north of 'old' with a newer reading - takes its slot
+        station('new', 45.0 + 100 * degreesPerMeter, 6.0,
+            source: WeatherStationSource.nws, observedAt: observedAt.add(const Duration(minutes: 30))),
+        // 100m south of 'old' but 200m from 'new' - only merged if the kept
+        // coordinates still point at 'old'
+        station('south', 45.0 - 100 * degreesPerMeter, 6.0, source: WeatherStationSource.pioupiou),
+      ]);
+
+      expect(result.map((s) => s.id), ['new', 'south']);
+    });
+  });
+}